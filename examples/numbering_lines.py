@@ -1,3 +1,5 @@
+import re
+
 from monapy import Step
 
 class Split(Step):
@@ -5,16 +7,41 @@ class Split(Step):
 		self._ch = char
 
 	def make(self, val, **kw):
-		return val.split(self._ch)
+		if self._ch == '\n':
+			return val.splitlines()
+		return self._iter_split(val)
+
+	def _iter_split(self, val):
+		ch = self._ch
+		find = val.find
+		start = 0
+		while True:
+			i = find(ch, start)
+			if i == -1:
+				yield val[start:]
+				return
+			yield val[start:i]
+			start = i + len(ch)
 
 class Numbering(Step):
 	def __init__(self, fmt):
 		self._fmt = fmt
 		self._num = 0
+		# a single-%d format needs no % dispatch per line
+		match = re.match(r'^%d([^%]*)$', fmt)
+		if match:
+			self._format = lambda n, s=match.group(1): f'{n}{s}'
+		else:
+			self._format = lambda n, f=fmt: f % n
 
 	def make(self, val, **kw):
+		# kept for direct calls; chains number statelessly through make_all
 		self._num += 1
-		return [''.join([self._fmt % self._num, val])]
+		return (self._format(self._num) + val,)
+
+	def make_all(self, values, **kw):
+		fmt = self._format
+		return (fmt(i) + val for i, val in enumerate(values, 1))
 
 text = '''Python is an interpreted, high-level
 and general-purpose programming language.
@@ -40,4 +67,3 @@ print(*chain(text), sep='\n')
 # 7. aim to help programmers write clear,
 # 8. logical code for small and large-scale
 # 9. projects.
-# 10.
@@ -10,6 +10,7 @@ if sys.version_info.major < 3 or sys.version_info.minor < 6:
     raise ImportError('Python < 3.6 is unsupported.')
 
 from .binding import Binder
+from .binding import pure
 from .step import Step
 
 __title__ = 'Monapy'
@@ -19,4 +20,4 @@ __author__ = 'Andriy Stremeluk'
 __license__ = 'MIT'
 __copyright__ = 'Copyright © 2020-2023 Andriy Stremeluk'
 
-__all__ = ['Step', 'Binder']
+__all__ = ['Step', 'Binder', 'pure']
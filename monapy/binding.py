@@ -1,9 +1,14 @@
 # -*- coding: utf-8 -*-
 ''' Simple monad implementation. '''
 
-from itertools import chain
 from functools import partial
-from functools import reduce
+from functools import lru_cache
+
+
+def pure(func):
+    ''' mark a unary function as side-effect free, letting Binder fuse it '''
+    func._monapy_pure = True
+    return func
 
 
 class Binder:
@@ -21,8 +26,32 @@ class Binder:
         >>> binder( 10 )
         [0, 20, 40, 60, 80]
     '''
-    def __init__(self, *functions):
-        self._func_chain = list(functions)
+    def __init__(self, *functions, cache=None):
+        ''' cache is an int maxsize for opt-in memoization of call results '''
+        self._func_chain = tuple(functions)
+        self._hash = hash(self._func_chain)
+        self._compiled = None
+        self._memo = None if cache is None else lru_cache(maxsize=cache)(self.call)
+
+    @classmethod
+    def _from_tuple(cls, functions):
+        ''' build a Binder around an already-built functions tuple '''
+        binder = cls.__new__(cls)
+        binder._func_chain = functions
+        binder._hash = hash(functions)
+        binder._compiled = None
+        binder._memo = None
+        return binder
+
+    def __hash__(self):
+        ''' pipeline identity, usable as a memoization key '''
+        return self._hash
+
+    def __eq__(self, other):
+        ''' Binders built from the same callables compare equal '''
+        if not isinstance(other, Binder):
+            return NotImplemented
+        return self._func_chain == other._func_chain
 
     def __rshift__(self, obj):
         ''' call to Binder.bind '''
@@ -33,31 +62,92 @@ class Binder:
         return self.lbind(obj)
 
     def __call__(self, *args, **kwargs):
-        ''' call to Binder.call '''
+        ''' call to Binder.call, through the memo cache when enabled '''
+        if self._memo is not None and not kwargs:
+            try:
+                hash(args)
+            except TypeError:
+                pass
+            else:
+                return self._memo(*args)
         return self.call(*args, **kwargs)
 
     def bind(self, obj):
         ''' bind a function (callable object) with last function in the chain '''
-        if not hasattr(obj, '__call__'):
+        if not callable(obj):
             raise TypeError('Must be callable')
 
-        functions = self._func_chain[:]
-        functions.append(obj)
-        return Binder(*functions)
+        functions = self._func_chain
+        if functions and getattr(functions[-1], '_monapy_pure', False) \
+                and getattr(obj, '_monapy_pure', False):
+            fused = pure(lambda val, _f=functions[-1], _g=obj: _g(_f(val)))
+            return Binder._from_tuple(functions[:-1] + (fused,))
+        return Binder._from_tuple(functions + (obj,))
 
     def lbind(self, obj):
         ''' set positional argument for last function in the chain '''
-        functions = self._func_chain[:]
-        _func = functions.pop()
-        functions.append(partial(_func, obj))
-        return Binder(*functions)
+        _func = self._func_chain[-1]
+        if isinstance(_func, partial):
+            bound = partial(_func.func, *_func.args, obj, **_func.keywords)
+        else:
+            bound = partial(_func, obj)
+        return Binder._from_tuple(self._func_chain[:-1] + (bound,))
+
+    def _compile(self):
+        ''' lower the chain to one straight-line function via exec '''
+        names = [f'_f{i}' for i in range(len(self._func_chain))]
+        lines = ['def _pipe(*args, **kwargs):',
+                 f'    val = {names[0]}(*args, **kwargs)']
+        lines.extend(f'    val = {name}(val)' for name in names[1:])
+        lines.append('    return val')
+        namespace = dict(zip(names, self._func_chain))
+        exec('\n'.join(lines), namespace)
+        return namespace['_pipe']
+
+    def iter(self, *args, **kwargs):
+        '''
+        call to functions chain, skipping a terminal list/tuple/set/frozenset
+        collector so the result stays a lazy iterator
+        '''
+        functions = self._func_chain
+        if functions and functions[-1] in (list, tuple, set, frozenset):
+            if len(functions) == 1:
+                if len(args) == 1 and not kwargs:
+                    return iter(args[0])
+                return iter(self.call(*args, **kwargs))
+            return Binder._from_tuple(functions[:-1]).call(*args, **kwargs)
+        return self.call(*args, **kwargs)
+
+    def compile_numba(self):
+        '''
+        Fuse the chain into a single numba.njit kernel of one argument.
+        Used when every stage is already a numba dispatcher;
+        otherwise (or without numba installed) return the plain call path.
+        '''
+        try:
+            from numba import njit
+            from numba.core.dispatcher import Dispatcher
+        except ImportError:
+            return self.call
+
+        functions = self._func_chain
+        if not functions or not all(isinstance(func, Dispatcher)
+                                    for func in functions):
+            return self.call
+
+        names = [f'_f{i}' for i in range(len(functions))]
+        lines = ['def _kernel(val):']
+        lines.extend(f'    val = {name}(val)' for name in names)
+        lines.append('    return val')
+        namespace = dict(zip(names, functions))
+        exec('\n'.join(lines), namespace)
+        return njit(namespace['_kernel'])
 
     def call(self, *args, **kwargs):
         ''' call to functions chain '''
         if not self._func_chain:
             return
-        
-        first_func = self._func_chain[0]
-        other_funcs = self._func_chain[1:]
-        return reduce(lambda val, func: func(val),
-                      chain([first_func(*args, **kwargs)], other_funcs))
+
+        if self._compiled is None:
+            self._compiled = self._compile()
+        return self._compiled(*args, **kwargs)
@@ -177,5 +177,6 @@ it could be used for paralleling.
 '''
 
 from .core import Step
+from .jit import jit_step
 
-__all__ = ['Step']
+__all__ = ['Step', 'jit_step']
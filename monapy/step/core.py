@@ -5,8 +5,11 @@
 import logging
 
 from itertools import chain
-from functools import reduce
-from itertools import tee
+from itertools import zip_longest
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
 
 
 logger = logging.getLogger(__name__)
@@ -16,6 +19,8 @@ handler.setFormatter(fmt)
 logger.addHandler(handler)
 logger.setLevel(logging.WARNING)
 
+_SENTINEL = object()
+
 
 def to_step(step):
     '''
@@ -23,20 +28,30 @@ def to_step(step):
     '''
     if isinstance(step, Step):
         return step
-    elif isinstance(step, tuple):
-        return TupleStep(step)
-    elif isinstance(step, list):
-        return ListStep(step)
-    elif isinstance(step, dict):
-        return DictStep(step)
-    elif isinstance(step, set):
-        return SetStep(step)
-    else:
-        raise TypeError(f'to_step({type(step)}), supports only tuple, list, dict and set.')
+    step_class = _STEP_CLASSES.get(type(step))
+    if step_class is not None:
+        return step_class(step)
+    raise TypeError(f'to_step({type(step)}), supports only tuple, list, dict and set.')
 
 
 class Step:
     '''Abstract class must be implement'''
+    __slots__ = ('_compiled',)
+
+    _START_ROW = 'Step()'
+    _START_TEMPLATE = 'Step(%s)'
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._START_ROW = f'{cls.__name__}()'
+        cls._START_TEMPLATE = f'{cls.__name__}(%s)'
+        center_pos = round(len(cls.__name__) / 2)
+        spaces = ' ' * (center_pos - 1)
+        cls._TREE_SPACES = spaces
+        cls._TREE_PREFIX = f'{spaces}|__'
+        cls._TREE_CONT = f'{spaces}|  '
+        cls._TREE_INDENT = f'{spaces} {spaces}'
+
     def __repr__(self):
         return f'{self.__class__.__name__}()'
 
@@ -71,8 +86,22 @@ class Step:
         '''Make Or Step from current step and other step'''
         return OrChain([self, or_step])
 
+    def parallel(self, workers=None, mode='thread', chunksize=None, unordered=False):
+        '''Make Parallel Step that run this step across a worker pool'''
+        return ParallelStep(self, workers=workers, mode=mode,
+                            chunksize=chunksize, unordered=unordered)
+
     def _raw_tree(self, **kwargs):
-        return [f'{self.__class__.__name__}()']
+        '''Memoized per render, subtrees shared between parents build once'''
+        memo = kwargs.setdefault('_memo', {})
+        key = id(self)
+        rows = memo.get(key)
+        if rows is None:
+            rows = memo[key] = self._build_raw_tree(**kwargs)
+        return rows
+
+    def _build_raw_tree(self, **kwargs):
+        return [self._START_ROW]
 
     def get_str_tree(self, **kwargs):
         '''Internal structure of chain'''
@@ -80,9 +109,69 @@ class Step:
 
     def make_all(self, iterable, **kwargs):
         '''Method must be implement'''
-        return (value
-                for val in iterable
-                for value in self.make(val, **kwargs))
+        make = partial(self.make, **kwargs) if kwargs else self.make
+        return chain.from_iterable(map(make, iterable))
+
+    def compile(self):
+        '''
+        Fuse this step tree into a single generator function of
+        (value, **kwargs), generated at runtime. Runs of steps bound by
+        'bind' that keep the default 'make_all' become nested loops in
+        one frame; steps overriding 'make_all' (parallel or batch
+        steps) are threaded through it like StepChain.make does, and
+        loop, or and container steps stay leaves driven through their
+        own 'make'. The compiled function is cached on the instance and
+        dropped when the step is mutated in place by
+        bind/loop_bind/or_bind.
+        '''
+        run = getattr(self, '_compiled', None)
+        if run is not None:
+            return run
+
+        steps = _linearize_steps(self)
+        names = [f'_s{i}' for i in range(len(steps))]
+        namespace = dict(zip(names, steps))
+
+        groups = []
+        for name, step in zip(names, steps):
+            inline = type(step).make_all is Step.make_all
+            if inline and groups and groups[-1][0]:
+                groups[-1][1].append(name)
+            else:
+                groups.append((inline, [name]))
+
+        def fused_loop(run_names, head, indent, var):
+            rows = [head]
+            for i, name in enumerate(run_names[:-1]):
+                rows.append(f'{indent}for _v{i} in {name}.make({var}, **kwargs):')
+                indent += '    '
+                var = f'_v{i}'
+            rows.append(f'{indent}yield from {run_names[-1]}.make({var}, **kwargs)')
+            return rows
+
+        if len(groups) == 1 and groups[0][0]:
+            lines = fused_loop(groups[0][1], 'def _run(value, **kwargs):',
+                               '    ', 'value')
+        else:
+            lines = []
+            body = ['def _run(value, **kwargs):', '    it = (value,)']
+            for num, (inline, run_names) in enumerate(groups):
+                if not inline:
+                    body.append(f'    it = {run_names[0]}.make_all(it, **kwargs)')
+                    continue
+                lines.extend(fused_loop(run_names,
+                                        f'def _g{num}(it, **kwargs):\n'
+                                        '    for _v in it:',
+                                        '        ', '_v'))
+                lines.append('')
+                body.append(f'    it = _g{num}(it, **kwargs)')
+            body.append('    yield from it')
+            lines.extend(body)
+
+        exec('\n'.join(lines), namespace)
+        run = namespace['_run']
+        self._compiled = run
+        return run
 
     def make(self, value = object(), **kwargs):
         '''Main method of Step, must be implement'''
@@ -92,10 +181,19 @@ class Step:
 
 class StepChain(Step):
     '''Step related from other steps by 'bind', it is implementing chain'''
+    __slots__ = ('_chain', '_single')
+
     def __init__(self, steps):
         if not steps:
             raise ValueError('steps is empty')
-        self._chain = list(map(to_step, steps))
+        flat = []
+        for step in map(to_step, steps):
+            if type(step) is StepChain:
+                flat.extend(step._chain)
+            else:
+                flat.append(step)
+        self._chain = flat
+        self._single = len(self._chain) == 1
 
     def __repr__(self):
         chain_repr = ' >> '.join(map(repr, self._chain))
@@ -103,7 +201,13 @@ class StepChain(Step):
 
     def bind(self, next_step):
         '''Bind current step with other step'''
-        self._chain.append(to_step(next_step))
+        step = to_step(next_step)
+        if type(step) is StepChain:
+            self._chain.extend(step._chain)
+        else:
+            self._chain.append(step)
+        self._single = len(self._chain) == 1
+        self._compiled = None
         return self
 
     def loop_bind(self, step):
@@ -111,37 +215,36 @@ class StepChain(Step):
         last_step = self._chain.pop()
         new_step = LoopStep(last_step, step)
         self._chain.append(new_step)
+        self._compiled = None
         return self
         
     def unite_steps(self):
         '''Combining current steps'''
         return UnitedSteps(self)
 
-    def _raw_tree(self, **kwargs):
-        start_row = f'{self.__class__.__name__}({len(self._chain)})'
+    def _build_raw_tree(self, **kwargs):
+        start_row = self._START_TEMPLATE % len(self._chain)
 
         rows = [start_row]
-        if not self._chain:
-            return rows
 
         last_step = self._chain[-1]
         chain = self._chain[:-1]
 
-        center_pos = round(len(self.__class__.__name__) / 2)
-        spaces = ' ' * (center_pos - 1)
-        unders = '__'
-        sep = '|'
+        spaces = self._TREE_SPACES
+        prefix = self._TREE_PREFIX
+        cont = self._TREE_CONT
+        indent = self._TREE_INDENT
 
         for step in chain:
             _rows = step._raw_tree(**kwargs)
-            rows.append(f'{spaces}{sep}{unders}{_rows[0]}')
+            rows.append(prefix + _rows[0])
             if len(_rows) > 1:
-                rows.extend(f'{spaces}{sep}  {row}' for row in _rows[1:])
-                rows.append(f'{spaces}{sep}')
+                rows.extend(cont + row for row in _rows[1:])
+                rows.append(f'{spaces}|')
 
         _rows = last_step._raw_tree(**kwargs)
-        rows.append(f'{spaces}{sep}{unders}{_rows[0]}')
-        rows.extend(f'{spaces} {spaces}{row}' for row in _rows[1:])
+        rows.append(prefix + _rows[0])
+        rows.extend(indent + row for row in _rows[1:])
 
         return rows
 
@@ -151,15 +254,21 @@ class StepChain(Step):
 
     def make(self, value = object(), **kwargs):
         '''Main method of Step'''
-        if not self._chain:
+        chain_list = self._chain
+        if self._single:
+            yield from chain_list[0].make(value, **kwargs)
             return
 
-        yield from reduce(lambda iterable, step: step.make_all(iterable, **kwargs),
-                          chain([[value]], self._chain))
+        iterable = [value]
+        for step in chain_list:
+            iterable = step.make_all(iterable, **kwargs)
+        yield from iterable
 
 
 class LoopStep(Step):
     '''Step related from other steps by 'loop', it is implementing chain'''
+    __slots__ = ('_step', '_loop_step')
+
     def __init__(self, step, loop_step):
         self._step = to_step(step)
         self._loop_step = to_step(loop_step)
@@ -176,31 +285,29 @@ class LoopStep(Step):
         '''Combining current steps'''
         return UnitedSteps(self)
 
-    def _raw_tree(self, **kwargs):
-        start_row = f'{self.__class__.__name__}()'
-
-        rows = [start_row]
+    def _build_raw_tree(self, **kwargs):
+        rows = [self._START_ROW]
 
         last_step = self._loop_step
 
-        center_pos = round(len(self.__class__.__name__) / 2)
-        spaces = ' ' * (center_pos - 1)
-        unders = '__'
-        sep = '|'
+        spaces = self._TREE_SPACES
+        prefix = self._TREE_PREFIX
+        cont = self._TREE_CONT
+        indent = self._TREE_INDENT
 
         step = self._step
         _rows = step._raw_tree(**kwargs)
-        rows.append(f'{spaces}{sep}{unders}{_rows[0]}')
+        rows.append(prefix + _rows[0])
         if len(_rows) > 1:
-            rows.extend(f'{spaces}{sep}  {row}' for row in _rows[1:])
-            rows.append(f'{spaces}{sep}')
+            rows.extend(cont + row for row in _rows[1:])
+            rows.append(f'{spaces}|')
 
         _rows = last_step._raw_tree(**kwargs)
         if self._loop_step:
-            rows.append(f'{spaces}{sep}_<< {_rows[0]}')
+            rows.append(f'{spaces}|_<< {_rows[0]}')
         else:
-            rows.append(f'{spaces}{sep}{unders}{_rows[0]}')
-        rows.extend(f'{spaces} {spaces}{row}' for row in _rows[1:])
+            rows.append(prefix + _rows[0])
+        rows.extend(indent + row for row in _rows[1:])
 
         return rows
 
@@ -210,46 +317,117 @@ class LoopStep(Step):
 
     def make(self, value = object(), **kwargs):
         '''Main method of Step'''
-        iterable = self._step.make(value, **kwargs)
+        step = self._step
+        loop_step = self._loop_step
 
-        result, iterable = tee(iterable, 2)
-        for val in result:
-            yield val
+        buffer = list(step.make(value, **kwargs))
+        yield from buffer
 
         while True:
-            iterable = reduce(lambda iterable, step: step.make_all(iterable, **kwargs),
-                              chain([iterable], [self._loop_step, self._step]))
+            iterable = loop_step.make_all(buffer, **kwargs)
+            iterable = step.make_all(iterable, **kwargs)
 
-            sentinel = object()
-            value = next(iterable, sentinel)
-            iterable = chain([value], iterable)
-            if value is sentinel:
+            buffer = list(iterable)
+            if not buffer:
                 return
+            yield from buffer
+
+
+def _pool_make(make, value):
+    '''Materialize one 'make' call; runs inside ParallelStep workers.'''
+    return list(make(value))
+
+
+class ParallelStep(Step):
+    '''
+    Step that drives an inner step's 'make' across a worker pool.
+    Each 'make' call is materialized to a list inside its worker, so
+    generator steps really run in parallel. Mode 'thread' suits
+    blocking I/O steps; mode 'process' suits CPU-bound picklable steps.
+    'chunksize' batches values per task to amortize process IPC
+    (defaults to 64 in 'process' mode, 1 in 'thread' mode).
+    Order of values is preserved unless 'unordered' is set,
+    then values are yielded as workers finish.
+    '''
+    __slots__ = ('_step', '_workers', '_mode', '_chunksize', '_unordered')
+
+    def __init__(self, step, workers=None, mode='thread', chunksize=None,
+                 unordered=False):
+        if mode not in ('thread', 'process'):
+            raise ValueError("mode must be 'thread' or 'process'")
+        self._step = to_step(step)
+        self._workers = workers
+        self._mode = mode
+        if chunksize is None:
+            chunksize = 64 if mode == 'process' else 1
+        self._chunksize = chunksize
+        self._unordered = unordered
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({repr(self._step)})'
+
+    def _build_raw_tree(self, **kwargs):
+        rows = [self._START_ROW]
+
+        spaces = self._TREE_SPACES
+        prefix = self._TREE_PREFIX
+        indent = self._TREE_INDENT
+
+        _rows = self._step._raw_tree(**kwargs)
+        rows.append(prefix + _rows[0])
+        rows.extend(indent + row for row in _rows[1:])
+
+        return rows
+
+    def get_str_tree(self, **kwargs):
+        '''Internal structure of chain'''
+        return '\n'.join(self._raw_tree(**kwargs))
 
-            result, iterable = tee(iterable, 2)
-            yield from result
+    def make(self, value, **kwargs):
+        '''Main method of Step'''
+        return self._step.make(value, **kwargs)
+
+    def make_all(self, iterable, **kwargs):
+        '''Dispatch 'make' over the values through the worker pool'''
+        make = self._step.make
+        if kwargs:
+            make = partial(make, **kwargs)
+        task = partial(_pool_make, make)
+
+        pool_class = (ProcessPoolExecutor
+                      if self._mode == 'process'
+                      else ThreadPoolExecutor)
+        with pool_class(max_workers=self._workers) as pool:
+            if self._unordered:
+                futures = [pool.submit(task, value) for value in iterable]
+                for future in as_completed(futures):
+                    yield from future.result()
+            else:
+                for result in pool.map(task, iterable,
+                                       chunksize=self._chunksize):
+                    yield from result
 
 
 class UnitedSteps(Step):
+    __slots__ = ('_step',)
+
     def __init__(self, step):
         self._step = to_step(step)
 
     def __repr__(self):
         return f'{self.__class__.__name__}({repr(self._step)})'
 
-    def _raw_tree(self, **kwargs):
+    def _build_raw_tree(self, **kwargs):
         if kwargs.get('full', False) or kwargs.get('show_united', False):
-            rows = [f'{self.__class__.__name__}()']
+            rows = [self._START_ROW]
 
-            center_pos = round(len(self.__class__.__name__) / 2)
-            spaces = ' ' * (center_pos - 1)
-            unders = '__'
-            sep = '|'
+            prefix = self._TREE_PREFIX
+            indent = self._TREE_INDENT
 
             _rows = self._step._raw_tree(**kwargs)
-            rows.append(f'{spaces}{sep}{unders}{_rows[0]}')
+            rows.append(prefix + _rows[0])
             if len(_rows) > 1:
-                rows.extend(f'{spaces} {spaces}{row}' for row in _rows[1:])
+                rows.extend(indent + row for row in _rows[1:])
 
             return rows
         else:
@@ -268,9 +446,20 @@ class UnitedSteps(Step):
 
 
 class OrChain(Step):
-    '''Step related from other steps by 'or_bind', it is implementing chain'''
+    '''
+    Step related from other steps by 'or_bind', it is implementing chain.
+    Unlike StepChain, an empty chain is allowed: 'make' just yields nothing.
+    '''
+    __slots__ = ('_chain',)
+
     def __init__(self, steps):
-        self._chain = list(map(to_step, steps))
+        flat = []
+        for step in map(to_step, steps):
+            if type(step) is OrChain:
+                flat.extend(step._chain)
+            else:
+                flat.append(step)
+        self._chain = flat
 
     def __repr__(self):
         chain_repr = ' | '.join(map(repr, self._chain))
@@ -278,15 +467,20 @@ class OrChain(Step):
 
     def or_bind(self, or_step):
         '''Make Or Step from current step and other step'''
-        self._chain.append(to_step(or_step))
+        step = to_step(or_step)
+        if type(step) is OrChain:
+            self._chain.extend(step._chain)
+        else:
+            self._chain.append(step)
+        self._compiled = None
         return self
         
     def unite_steps(self):
         '''Combining current steps'''
         return UnitedSteps(self)
 
-    def _raw_tree(self, **kwargs):
-        start_row = f'{self.__class__.__name__}({len(self._chain)})'
+    def _build_raw_tree(self, **kwargs):
+        start_row = self._START_TEMPLATE % len(self._chain)
 
         rows = [start_row]
         if not self._chain:
@@ -295,21 +489,21 @@ class OrChain(Step):
         last_step = self._chain[-1]
         chain = self._chain[:-1]
 
-        center_pos = round(len(self.__class__.__name__) / 2)
-        spaces = ' ' * (center_pos - 1)
-        unders = '__'
-        sep = '|'
+        spaces = self._TREE_SPACES
+        prefix = self._TREE_PREFIX
+        cont = self._TREE_CONT
+        indent = self._TREE_INDENT
 
         for step in chain:
             _rows = step._raw_tree(**kwargs)
-            rows.append(f'{spaces}{sep}{unders}{_rows[0]}')
+            rows.append(prefix + _rows[0])
             if len(_rows) > 1:
-                rows.extend(f'{spaces}{sep}  {row}' for row in _rows[1:])
-                rows.append(f'{spaces}{sep}')
+                rows.extend(cont + row for row in _rows[1:])
+                rows.append(f'{spaces}|')
 
         _rows = last_step._raw_tree(**kwargs)
-        rows.append(f'{spaces}{sep}{unders}{_rows[0]}')
-        rows.extend(f'{spaces} {spaces}{row}' for row in _rows[1:])
+        rows.append(prefix + _rows[0])
+        rows.extend(indent + row for row in _rows[1:])
 
         return rows
 
@@ -321,15 +515,17 @@ class OrChain(Step):
         '''Main method of Step'''
         for step in self._chain:
             iterator = iter(step.make(value, **kwargs))
-            sentinel = object()
-            val = next(iterator, sentinel)
-            if val is sentinel:
+            val = next(iterator, _SENTINEL)
+            if val is _SENTINEL:
                 continue
-            yield from chain([val], iterator)
+            yield val
+            yield from iterator
             return
 
 
 class TupleStep(Step):
+    __slots__ = ('_steps',)
+
     def __init__(self, steps):
         self._steps = steps
 
@@ -344,8 +540,8 @@ class TupleStep(Step):
         items_repr = ', '.join((repr(step) for step in self._steps))
         return f'{self.__class__.__name__}(({items_repr}))'
 
-    def _raw_tree(self, **kwargs):
-        start_row = f'{self.__class__.__name__}({len(self._steps)})'
+    def _build_raw_tree(self, **kwargs):
+        start_row = self._START_TEMPLATE % len(self._steps)
 
         rows = [start_row]
         if not self._steps:
@@ -354,21 +550,21 @@ class TupleStep(Step):
         last_step = self._steps[-1]
         chain = self._steps[:-1]
 
-        center_pos = round(len(self.__class__.__name__) / 2)
-        spaces = ' ' * (center_pos - 1)
-        unders = '__'
-        sep = '|'
+        spaces = self._TREE_SPACES
+        prefix = self._TREE_PREFIX
+        cont = self._TREE_CONT
+        indent = self._TREE_INDENT
 
         for step in chain:
             _rows = step._raw_tree(**kwargs)
-            rows.append(f'{spaces}{sep}{unders}{_rows[0]}')
+            rows.append(prefix + _rows[0])
             if len(_rows) > 1:
-                rows.extend(f'{spaces}{sep}  {row}' for row in _rows[1:])
-                rows.append(f'{spaces}{sep}')
+                rows.extend(cont + row for row in _rows[1:])
+                rows.append(f'{spaces}|')
 
         _rows = last_step._raw_tree(**kwargs)
-        rows.append(f'{spaces}{sep}{unders}{_rows[0]}')
-        rows.extend(f'{spaces} {spaces}{row}' for row in _rows[1:])
+        rows.append(prefix + _rows[0])
+        rows.extend(indent + row for row in _rows[1:])
 
         return rows
 
@@ -378,13 +574,13 @@ class TupleStep(Step):
 
     def make(self, value, **kwargs):
         '''Main method of Step'''
-        iterables = tuple(iter(step.make(value, **kwargs))
-                          for step in self._steps)
-        
-        return (tuple(it) for it in zip(*iterables))
+        iterables = [step.make(value, **kwargs) for step in self._steps]
+        yield from zip(*iterables)
 
 
 class ListStep(Step):
+    __slots__ = ('_steps',)
+
     def __init__(self, steps):
         self._steps = steps
 
@@ -399,8 +595,8 @@ class ListStep(Step):
         items_repr = ', '.join((repr(s) for s in self._steps))
         return f'{self.__class__.__name__}([{items_repr}])'
 
-    def _raw_tree(self, **kwargs):
-        start_row = f'{self.__class__.__name__}({len(self._steps)})'
+    def _build_raw_tree(self, **kwargs):
+        start_row = self._START_TEMPLATE % len(self._steps)
 
         rows = [start_row]
         if not self._steps:
@@ -409,21 +605,21 @@ class ListStep(Step):
         last_step = self._steps[-1]
         chain = self._steps[:-1]
 
-        center_pos = round(len(self.__class__.__name__) / 2)
-        spaces = ' ' * (center_pos - 1)
-        unders = '__'
-        sep = '|'
+        spaces = self._TREE_SPACES
+        prefix = self._TREE_PREFIX
+        cont = self._TREE_CONT
+        indent = self._TREE_INDENT
 
         for step in chain:
             _rows = step._raw_tree(**kwargs)
-            rows.append(f'{spaces}{sep}{unders}{_rows[0]}')
+            rows.append(prefix + _rows[0])
             if len(_rows) > 1:
-                rows.extend(f'{spaces}{sep}  {row}' for row in _rows[1:])
-                rows.append(f'{spaces}{sep}')
+                rows.extend(cont + row for row in _rows[1:])
+                rows.append(f'{spaces}|')
 
         _rows = last_step._raw_tree(**kwargs)
-        rows.append(f'{spaces}{sep}{unders}{_rows[0]}')
-        rows.extend(f'{spaces} {spaces}{row}' for row in _rows[1:])
+        rows.append(prefix + _rows[0])
+        rows.extend(indent + row for row in _rows[1:])
 
         return rows
 
@@ -433,22 +629,15 @@ class ListStep(Step):
 
     def make(self, value, **kwargs):
         '''Main method of Step'''
-        iterables = tuple(iter(step.make(value, **kwargs))
-                          for step in self._steps)
+        iterables = [step.make(value, **kwargs) for step in self._steps]
 
-        sentinel = object()
-        while True:
-            result_list = [val
-                           for val in (next(it, sentinel) for it in iterables)
-                           if val is not sentinel]
-            
-            if len(result_list) > 0:
-                yield result_list
-            else:
-                return
+        for row in zip_longest(*iterables, fillvalue=_SENTINEL):
+            yield [val for val in row if val is not _SENTINEL]
 
 
 class DictStep(Step):
+    __slots__ = ('_steps',)
+
     def __init__(self, steps):
         self._steps = steps
 
@@ -464,8 +653,8 @@ class DictStep(Step):
         lbrace, rbrace = '{', '}'
         return f'{self.__class__.__name__}({lbrace}{items_repr}{rbrace})'
 
-    def _raw_tree(self, **kwargs):
-        start_row  = f'{self.__class__.__name__}({len(self._steps)})'
+    def _build_raw_tree(self, **kwargs):
+        start_row = self._START_TEMPLATE % len(self._steps)
         rows = [start_row]
         if not self._steps:
             return rows
@@ -475,22 +664,22 @@ class DictStep(Step):
         last_step = steps[-1]
         chain = steps[:-1]
 
-        center_pos = round(len(self.__class__.__name__) / 2)
-        spaces = ' ' * (center_pos - 1)
-        unders = '__'
-        sep = '|'
+        spaces = self._TREE_SPACES
+        prefix = self._TREE_PREFIX
+        cont = self._TREE_CONT
+        indent = self._TREE_INDENT
 
         for key, step in chain:
             _rows = step._raw_tree(**kwargs)
-            rows.append(f'{spaces}{sep}{unders}{repr(key)}: {_rows[0]}')
+            rows.append(f'{prefix}{repr(key)}: {_rows[0]}')
             if len(_rows) > 1:
-                rows.extend(f'{spaces}{sep}  {row}' for row in _rows[1:])
-                rows.append(f'{spaces}{sep}')
+                rows.extend(cont + row for row in _rows[1:])
+                rows.append(f'{spaces}|')
 
         key = last_step[0]
         _rows = last_step[1]._raw_tree(**kwargs)
-        rows.append(f'{spaces}{sep}{unders}{repr(key)}: {_rows[0]}')
-        rows.extend(f'{spaces} {spaces}{row}' for row in _rows[1:])
+        rows.append(f'{prefix}{repr(key)}: {_rows[0]}')
+        rows.extend(indent + row for row in _rows[1:])
 
         return rows
 
@@ -500,22 +689,18 @@ class DictStep(Step):
 
     def make(self, value, **kwargs):
         '''Main method of Step'''
-        iterables = tuple([key, iter(step.make(value, **kwargs))]
-                          for key, step in self._steps.items())
+        keys = list(self._steps)
+        iterables = [step.make(value, **kwargs) for step in self._steps.values()]
 
-        sentinel = object()
-        while True:
-            result_dict = {key: val
-                           for key, val in ([key, next(it, sentinel)] for key, it in iterables)
-                           if val is not sentinel}
-            
-            if len(result_dict) > 0:
-                yield result_dict
-            else:
-                return
+        for row in zip_longest(*iterables, fillvalue=_SENTINEL):
+            yield {key: val
+                   for key, val in zip(keys, row)
+                   if val is not _SENTINEL}
 
 
 class SetStep(Step):
+    __slots__ = ('_steps',)
+
     def __init__(self, steps):
         self._steps = steps
 
@@ -531,9 +716,9 @@ class SetStep(Step):
         lbrace, rbrace = '{', '}'
         return f'{self.__class__.__name__}({lbrace}{items_repr}{rbrace})'
 
-    def _raw_tree(self, **kwargs):
+    def _build_raw_tree(self, **kwargs):
         steps = tuple(self._steps)
-        start_row = f'{self.__class__.__name__}({len(steps)})'
+        start_row = self._START_TEMPLATE % len(steps)
 
         rows = [start_row]
         if not steps:
@@ -542,21 +727,21 @@ class SetStep(Step):
         last_step = steps[-1]
         chain = steps[:-1]
 
-        center_pos = round(len(self.__class__.__name__) / 2)
-        spaces = ' ' * (center_pos - 1)
-        unders = '__'
-        sep = '|'
+        spaces = self._TREE_SPACES
+        prefix = self._TREE_PREFIX
+        cont = self._TREE_CONT
+        indent = self._TREE_INDENT
 
         for step in chain:
             _rows = step._raw_tree(**kwargs)
-            rows.append(f'{spaces}{sep}{unders}{_rows[0]}')
+            rows.append(prefix + _rows[0])
             if len(_rows) > 1:
-                rows.extend(f'{spaces}{sep}  {row}' for row in _rows[1:])
-                rows.append(f'{spaces}{sep}')
+                rows.extend(cont + row for row in _rows[1:])
+                rows.append(f'{spaces}|')
 
         _rows = last_step._raw_tree(**kwargs)
-        rows.append(f'{spaces}{sep}{unders}{_rows[0]}')
-        rows.extend(f'{spaces} {spaces}{row}' for row in _rows[1:])
+        rows.append(prefix + _rows[0])
+        rows.extend(indent + row for row in _rows[1:])
 
         return rows
 
@@ -566,16 +751,28 @@ class SetStep(Step):
 
     def make(self, value, **kwargs):
         '''Main method of Step'''
-        iterables = tuple(iter(step.make(value, **kwargs))
-                          for step in self._steps)
+        iterables = [step.make(value, **kwargs) for step in self._steps]
 
-        sentinel = object()
-        while True:
-            result_set = {val
-                          for val in (next(it, sentinel) for it in iterables)
-                          if val is not sentinel}
-            
-            if len(result_set) > 0:
-                yield result_set
-            else:
-                return
+        for row in zip_longest(*iterables, fillvalue=_SENTINEL):
+            yield {val for val in row if val is not _SENTINEL}
+
+def _linearize_steps(step):
+    '''
+    Flatten StepChain/UnitedSteps nesting into a sequence of leaf steps.
+    '''
+    if type(step) is StepChain:
+        leaves = []
+        for inner in step._chain:
+            leaves.extend(_linearize_steps(inner))
+        return leaves
+    if type(step) is UnitedSteps:
+        return _linearize_steps(step._step)
+    return [step]
+
+
+_STEP_CLASSES = {
+    tuple: TupleStep,
+    list: ListStep,
+    dict: DictStep,
+    set: SetStep,
+}
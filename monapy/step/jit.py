@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+''' Optional numba compilation for user-defined numeric Steps. '''
+
+import inspect
+
+
+def jit_step(cls):
+    '''
+    Class decorator that compiles a Step's 'make' with numba.njit.
+    'make' must be declared as a staticmethod taking the value and
+    returning a sequence of numeric values — numba cannot compile
+    methods over Step instances, and its generators run slower than
+    its loops, so generator makes are left alone.
+    The first call pays the compilation cost; kernels are cached
+    on disk between runs.
+    When numba is not installed the class is returned unchanged.
+    ##### Examples:
+        >>> from monapy import Step
+        >>> from monapy.step import jit_step
+        >>> @jit_step
+        ... class Squares(Step):
+        ...     @staticmethod
+        ...     def make(value):
+        ...         return [i * i for i in range(value)]
+    '''
+    try:
+        from numba import njit
+    except ImportError:
+        return cls
+
+    raw_make = inspect.getattr_static(cls, 'make')
+    if not isinstance(raw_make, staticmethod):
+        return cls
+    func = raw_make.__func__
+    if inspect.isgeneratorfunction(func):
+        return cls
+
+    kernel = njit(cache=True)(func)
+
+    def make(self, value, **kwargs):
+        '''Main method of Step, runs the compiled kernel'''
+        return kernel(value)
+
+    cls._jit_kernel = kernel
+    cls.make = make
+    return cls
@@ -4,6 +4,7 @@ import pytest
 
 from monapy import Binder
 from monapy import Step
+from monapy import pure
 
 
 class Iters(Step):
@@ -55,6 +56,42 @@ def test_binder():
   assert b(5) == [10, 20, 30, 40]
 
 
+def test_binder_cache():
+  calls = []
+  b = Binder(calls.append, lambda _: len(calls), cache=8)
+
+  assert b(1) == 1
+  assert b(1) == 1
+  assert b(2) == 2
+
+
+def test_binder_iter():
+  b = Binder() >> range >> map << (lambda i: i * 10) >> list
+
+  it = b.iter(5)
+
+  assert not isinstance(it, list)
+  assert list(it) == b(5)
+
+  collector = Binder(list)
+
+  assert list(collector.iter(range(3))) == collector(range(3))
+
+
+def test_binder_compile_numba_fallback():
+  b = Binder() >> (lambda i: i + 1) >> (lambda i: i * 10)
+  compiled = b.compile_numba()
+
+  assert compiled(4) == b(4)
+
+
+def test_binder_pure_fuse():
+  b = Binder() >> pure(lambda i: i + 1) >> pure(lambda i: i * 10)
+
+  assert len(b._func_chain) == 1
+  assert b(4) == 50
+
+
 def test_step():
   step = Repeat('t', 2)
 
@@ -99,6 +136,36 @@ def test_union_step():
   assert result1 == ('4',) * 4
 
 
+def test_jit_step():
+  from monapy.step import jit_step
+
+  @jit_step
+  class Squares(Step):
+    @staticmethod
+    def make(value):
+      return [i * i for i in range(value)]
+
+  step = Iters([3]) >> Squares()
+
+  result = tuple(step.make(0))
+
+  assert result == (0, 1, 4)
+
+
+def test_parallel_step():
+  step = Iters('abc') >> Repeat('p', 2).parallel(workers=2)
+
+  print(step.get_str_tree())
+
+  result = tuple(step.make(0))
+
+  assert result == ('p',) * 6
+
+  unordered = Iters('abc') >> Repeat('p', 2).parallel(workers=2, unordered=True)
+
+  assert tuple(unordered.make(0)) == ('p',) * 6
+
+
 def test_or_chain():
   step = Iters('abcdefghjk') >> (ReturnEquals('afzk') | ReturnEquals('bateh') | ReturnEquals('cbdjx'))
 
@@ -109,6 +176,43 @@ def test_or_chain():
   assert result == tuple('abcdefhjk')
 
 
+def test_compile():
+  step = Iters('abcdefghjk') >> (ReturnEquals('afzk') | ReturnEquals('bateh')) >> Repeat('c', 2)
+
+  run = step.compile()
+
+  assert tuple(run(0)) == tuple(step.make(0))
+  assert step.compile() is run
+
+  step >> Repeat('d')
+
+  assert tuple(step.compile()(0)) == tuple(step.make(0))
+
+
+def test_compile_make_all():
+  class Numbered(Step):
+    def __init__(self):
+      self._num = 0
+
+    def make(self, value):
+      self._num += 1
+      yield f'{self._num}{value}'
+
+    def make_all(self, values, **kwargs):
+      return (f'{i}{val}' for i, val in enumerate(values, 1))
+
+  step = Iters('ab') >> Numbered() >> Repeat('x', 2)
+
+  run = step.compile()
+
+  assert tuple(run(0)) == tuple(step.make(0))
+  assert tuple(run(0)) == tuple(step.make(0))
+
+  parallel = Iters('ab') >> Repeat('p', 2).parallel(workers=2)
+
+  assert tuple(parallel.compile()(0)) == ('p',) * 4
+
+
 def test_tuple_step():
   step = Iters('abcdefghjk') >> (ReturnEquals('abc'), ReturnEquals('ab'), ReturnEquals('a'))
 